@@ -8,7 +8,8 @@ Creates clean, modern blue icons similar to UWorld style
 - Clean, professional medical blue theme
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw, ImageFont, ImageOps
+from functools import lru_cache
 import sys
 import os
 
@@ -19,17 +20,22 @@ LIGHT_BLUE = '#5BA3FF'        # Light blue for accents
 WHITE = '#FFFFFF'
 GOLD = '#FFD700'              # For "Rx" and author credit
 
+# Labels smaller than this (e.g. on the favicon) are drawn without an outline
+MIN_OUTLINE_FONT_SIZE = 12
+
+# Candidate fonts in order of preference, as (bold, regular) paths
+FONT_OPTIONS = (
+    ('/system/fonts/Roboto-Bold.ttf', '/system/fonts/Roboto-Regular.ttf'),
+    ('/system/fonts/DroidSans-Bold.ttf', '/system/fonts/DroidSans.ttf'),
+    ('/data/data/com.termux/files/usr/share/fonts/TTF/DejaVuSans-Bold.ttf', '/data/data/com.termux/files/usr/share/fonts/TTF/DejaVuSans.ttf'),
+)
+
+@lru_cache(maxsize=64)
 def get_font(size, bold=False):
     """Get the best available font"""
-    font_options = [
-        '/system/fonts/Roboto-Bold.ttf' if bold else '/system/fonts/Roboto-Regular.ttf',
-        '/system/fonts/DroidSans-Bold.ttf' if bold else '/system/fonts/DroidSans.ttf',
-        '/data/data/com.termux/files/usr/share/fonts/TTF/DejaVuSans-Bold.ttf' if bold else '/data/data/com.termux/files/usr/share/fonts/TTF/DejaVuSans.ttf',
-        None
-    ]
-    
-    for font_path in font_options:
-        if font_path and os.path.exists(font_path):
+    for bold_path, regular_path in FONT_OPTIONS:
+        font_path = bold_path if bold else regular_path
+        if os.path.exists(font_path):
             try:
                 return ImageFont.truetype(font_path, size)
             except:
@@ -37,33 +43,19 @@ def get_font(size, bold=False):
     
     return ImageFont.load_default()
 
+@lru_cache(maxsize=32)
 def hex_to_rgb(hex_color):
     """Convert hex color to RGB tuple"""
     hex_color = hex_color.lstrip('#')
     return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
 
-def create_gradient_background(draw, width, height, color_top, color_bottom):
-    """Create smooth vertical gradient"""
-    r1, g1, b1 = hex_to_rgb(color_top)
-    r2, g2, b2 = hex_to_rgb(color_bottom)
-    
-    for y in range(height):
-        ratio = y / height
-        r = int(r1 + (r2 - r1) * ratio)
-        g = int(g1 + (g2 - g1) * ratio)
-        b = int(b1 + (b2 - b1) * ratio)
-        draw.line([(0, y), (width, y)], fill=(r, g, b))
-
-def draw_text_with_outline(draw, position, text, font, fill_color, outline_color, outline_width=2):
-    """Draw text with outline for better readability"""
-    x, y = position
-    # Draw outline
-    for adj_x in range(-outline_width, outline_width + 1):
-        for adj_y in range(-outline_width, outline_width + 1):
-            if adj_x != 0 or adj_y != 0:
-                draw.text((x + adj_x, y + adj_y), text, font=font, fill=hex_to_rgb(outline_color))
-    # Draw main text
-    draw.text((x, y), text, font=font, fill=hex_to_rgb(fill_color))
+def create_gradient_background(width, height, color_top, color_bottom):
+    """Create smooth vertical gradient image"""
+    # Colour one column of Pillow's built-in ramp, then scale it to size
+    ramp = Image.linear_gradient('L').crop((0, 0, 1, 256))
+    column = ImageOps.colorize(ramp, black=hex_to_rgb(color_top), white=hex_to_rgb(color_bottom))
+    column = column.resize((1, height), Image.Resampling.BILINEAR)
+    return column.resize((width, height), Image.Resampling.NEAREST)
 
 def create_app_icon(size=1024):
     """
@@ -75,12 +67,13 @@ def create_app_icon(size=1024):
     """
     print(f"  Creating app icon ({size}x{size})...")
     
-    # Create image with gradient
-    icon = Image.new('RGB', (size, size), hex_to_rgb(PRIMARY_BLUE))
+    # Create image with gradient background
+    icon = create_gradient_background(size, size, LIGHT_BLUE, DARK_BLUE)
     draw = ImageDraw.Draw(icon)
     
-    # Create gradient background
-    create_gradient_background(draw, size, size, LIGHT_BLUE, DARK_BLUE)
+    # Keep outlines proportional so small icons stay legible
+    outline_rx = max(1, size // 256)
+    outline_small = max(1, size // 512)
     
     # Large "Rx" text in center
     font_rx = get_font(int(size * 0.5), bold=True)
@@ -94,12 +87,14 @@ def create_app_icon(size=1024):
         y = (size - text_height) // 2 - int(size * 0.05)
         
         # Draw "Rx" with white color and outline
-        draw_text_with_outline(draw, (x, y), text_rx, font_rx, WHITE, DARK_BLUE, 4)
+        draw.text((x, y), text_rx, font=font_rx, fill=hex_to_rgb(WHITE),
+                  stroke_width=outline_rx, stroke_fill=hex_to_rgb(DARK_BLUE))
     except Exception as e:
         print(f"    Note: Using default font - {e}")
     
     # "UWtopia" text above Rx
-    font_app = get_font(int(size * 0.1), bold=True)
+    size_app = int(size * 0.1)
+    font_app = get_font(size_app, bold=True)
     text_app = "UWtopia"
     
     try:
@@ -108,12 +103,15 @@ def create_app_icon(size=1024):
         x = (size - text_width) // 2
         y = int(size * 0.15)
         
-        draw_text_with_outline(draw, (x, y), text_app, font_app, WHITE, DARK_BLUE, 2)
+        outline = outline_small if size_app >= MIN_OUTLINE_FONT_SIZE else 0
+        draw.text((x, y), text_app, font=font_app, fill=hex_to_rgb(WHITE),
+                  stroke_width=outline, stroke_fill=hex_to_rgb(DARK_BLUE))
     except:
         pass
     
     # "@DrEndris" credit at bottom
-    font_credit = get_font(int(size * 0.055), bold=False)
+    size_credit = int(size * 0.055)
+    font_credit = get_font(size_credit, bold=False)
     credit_text = "@DrEndris"
     
     try:
@@ -122,7 +120,9 @@ def create_app_icon(size=1024):
         x = (size - text_width) // 2
         y = int(size * 0.85)
         
-        draw_text_with_outline(draw, (x, y), credit_text, font_credit, GOLD, DARK_BLUE, 2)
+        outline = outline_small if size_credit >= MIN_OUTLINE_FONT_SIZE else 0
+        draw.text((x, y), credit_text, font=font_credit, fill=hex_to_rgb(GOLD),
+                  stroke_width=outline, stroke_fill=hex_to_rgb(DARK_BLUE))
     except:
         pass
     
@@ -137,13 +137,10 @@ def create_adaptive_icon(size=1024):
     """
     print(f"  Creating adaptive icon ({size}x{size})...")
     
-    # White background for adaptive icon
-    icon = Image.new('RGB', (size, size), hex_to_rgb(WHITE))
+    # Subtle white-to-blue gradient for adaptive icon
+    icon = create_gradient_background(size, size, WHITE, LIGHT_BLUE)
     draw = ImageDraw.Draw(icon)
     
-    # Create subtle gradient
-    create_gradient_background(draw, size, size, WHITE, LIGHT_BLUE)
-    
     # Large "Rx" in blue
     font_rx = get_font(int(size * 0.55), bold=True)
     text_rx = "Rx"
@@ -155,7 +152,8 @@ def create_adaptive_icon(size=1024):
         x = (size - text_width) // 2
         y = (size - text_height) // 2 - int(size * 0.08)
         
-        draw_text_with_outline(draw, (x, y), text_rx, font_rx, PRIMARY_BLUE, WHITE, 3)
+        draw.text((x, y), text_rx, font=font_rx, fill=hex_to_rgb(PRIMARY_BLUE),
+                  stroke_width=3, stroke_fill=hex_to_rgb(WHITE))
     except:
         pass
     
@@ -169,7 +167,8 @@ def create_adaptive_icon(size=1024):
         x = (size - text_width) // 2
         y = int(size * 0.65)
         
-        draw_text_with_outline(draw, (x, y), text_app, font_app, PRIMARY_BLUE, WHITE, 2)
+        draw.text((x, y), text_app, font=font_app, fill=hex_to_rgb(PRIMARY_BLUE),
+                  stroke_width=2, stroke_fill=hex_to_rgb(WHITE))
     except:
         pass
     
@@ -186,11 +185,9 @@ def create_splash_screen(width=1284, height=2778):
     """
     print(f"  Creating splash screen ({width}x{height})...")
     
-    splash = Image.new('RGB', (width, height), hex_to_rgb(PRIMARY_BLUE))
-    draw = ImageDraw.Draw(splash)
-    
     # Gradient background
-    create_gradient_background(draw, width, height, LIGHT_BLUE, DARK_BLUE)
+    splash = create_gradient_background(width, height, LIGHT_BLUE, DARK_BLUE)
+    draw = ImageDraw.Draw(splash)
     
     # Large "Rx" in center
     font_rx = get_font(int(width * 0.5), bold=True)
@@ -203,7 +200,8 @@ def create_splash_screen(width=1284, height=2778):
         x = (width - text_width) // 2
         y = (height - text_height) // 2 - int(height * 0.1)
         
-        draw_text_with_outline(draw, (x, y), text_rx, font_rx, WHITE, DARK_BLUE, 5)
+        draw.text((x, y), text_rx, font=font_rx, fill=hex_to_rgb(WHITE),
+                  stroke_width=5, stroke_fill=hex_to_rgb(DARK_BLUE))
     except:
         pass
     
@@ -217,7 +215,8 @@ def create_splash_screen(width=1284, height=2778):
         x = (width - text_width) // 2
         y = int(height * 0.15)
         
-        draw_text_with_outline(draw, (x, y), text_title, font_title, WHITE, DARK_BLUE, 3)
+        draw.text((x, y), text_title, font=font_title, fill=hex_to_rgb(WHITE),
+                  stroke_width=3, stroke_fill=hex_to_rgb(DARK_BLUE))
     except:
         pass
     
@@ -231,7 +230,8 @@ def create_splash_screen(width=1284, height=2778):
         x = (width - text_width) // 2
         y = int(height * 0.24)
         
-        draw_text_with_outline(draw, (x, y), subtitle, font_subtitle, WHITE, DARK_BLUE, 2)
+        draw.text((x, y), subtitle, font=font_subtitle, fill=hex_to_rgb(WHITE),
+                  stroke_width=2, stroke_fill=hex_to_rgb(DARK_BLUE))
     except:
         pass
     
@@ -245,7 +245,8 @@ def create_splash_screen(width=1284, height=2778):
         x = (width - text_width) // 2
         y = int(height * 0.88)
         
-        draw_text_with_outline(draw, (x, y), credit, font_credit, GOLD, DARK_BLUE, 2)
+        draw.text((x, y), credit, font=font_credit, fill=hex_to_rgb(GOLD),
+                  stroke_width=2, stroke_fill=hex_to_rgb(DARK_BLUE))
     except:
         pass
     
@@ -262,25 +263,26 @@ def generate_all_assets():
         # 1. App Icon
         print("📱 Generating App Icon:")
         icon = create_app_icon(1024)
-        icon.save('assets/icon.png', 'PNG', optimize=True)
+        icon.save('assets/icon.png', 'PNG', compress_level=1)
         print("    ✓ Saved: assets/icon.png (1024x1024)")
         
         # 2. Adaptive Icon
         print("\n📱 Generating Adaptive Icon:")
         adaptive = create_adaptive_icon(1024)
-        adaptive.save('assets/adaptive-icon.png', 'PNG', optimize=True)
+        adaptive.save('assets/adaptive-icon.png', 'PNG', compress_level=1)
         print("    ✓ Saved: assets/adaptive-icon.png (1024x1024)")
         
         # 3. Splash Screen
         print("\n🖼️  Generating Splash Screen:")
         splash = create_splash_screen(1284, 2778)
-        splash.save('assets/splash.png', 'PNG', optimize=True)
+        splash.save('assets/splash.png', 'PNG', compress_level=1)
         print("    ✓ Saved: assets/splash.png (1284x2778)")
         
         # 4. Favicon
         print("\n🌐 Generating Favicon:")
-        favicon = icon.resize((48, 48), Image.Resampling.LANCZOS)
-        favicon.save('assets/favicon.png', 'PNG', optimize=True)
+        favicon = create_app_icon(48)
+        favicon = favicon.quantize(colors=64, method=Image.Quantize.FASTOCTREE)
+        favicon.save('assets/favicon.png', 'PNG', compress_level=1)
         print("    ✓ Saved: assets/favicon.png (48x48)")
         
         print("\n" + "="*60)
@@ -80,8 +80,16 @@ echo ""
 echo "🐍 Step 3: Installing Python dependencies..."
 
 if ! python -c "import PIL" &> /dev/null; then
-    echo "  Installing Pillow..."
-    pip install Pillow --break-system-packages
+    # Pillow-SIMD is a drop-in Pillow build with SSE4/AVX2 raster paths;
+    # it only helps on x86 CPUs, so ARM devices keep stock Pillow
+    if grep -qw avx2 /proc/cpuinfo 2> /dev/null; then
+        echo "  Installing Pillow-SIMD (AVX2)..."
+        CC="cc -mavx2" pip install pillow-simd --break-system-packages \
+            || pip install Pillow --break-system-packages
+    else
+        echo "  Installing Pillow..."
+        pip install Pillow --break-system-packages
+    fi
 else
     echo "✓ Pillow already installed"
 fi